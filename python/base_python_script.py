@@ -4,8 +4,6 @@ import re
 import shutil
 import signal
 import sys
-import traceback
-import types
 import yaml
 
 try:
@@ -60,16 +58,14 @@ def main() -> None:
         print("\nKeyboardInterrupt: Program interrupted by user. Exiting gracefully.")
         sys.exit(0)
     except Exception as e:
-        exit_with_error(e, traceback)
+        exit_with_error(e)
 
 
-def exit_with_error(e: Exception, tb_module: types.ModuleType) -> None:
+def exit_with_error(e: Exception) -> None:
     """Handles exceptions by printing error details and exiting the program.
 
     :param e:
         The exception instance raised by the program.
-    :param tb_module:
-        The traceback module used to extract error information.
 
     :returns: None
         This function does not return a value; it terminates the program.
@@ -80,11 +76,15 @@ def exit_with_error(e: Exception, tb_module: types.ModuleType) -> None:
     """
 
     print("Error raised by sub function:")
-    tbinfo = tb_module.extract_tb(sys.exc_info()[2])
+    # Only the innermost frame is needed, so walk to it instead of extracting
+    # the whole traceback
+    tb = e.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
     errclass = e.__class__.__name__
     errmessage = str(e) if str(e) else "no message"
     errnotes = e.__notes__ if hasattr(e, "__notes__") else []
-    errlineno = tbinfo[-1].lineno if tbinfo else "unknown"
+    errlineno = tb.tb_lineno if tb is not None else "unknown"
     print(f'{errclass}: "{errmessage}" at line {errlineno}')
 
     if errnotes:
@@ -13,16 +13,24 @@ Key features
 - Command-line interface with flexible mode specification
 - Automatic error handling for invalid input formats
 - Output to file or stdout
+- Batch conversion of files matching a glob pattern, spread over worker processes
 - Type-safe implementation with comprehensive error reporting
 
 Parameters
 ----------
 input_file : str
-    Path to the input file containing data in the source format
+    Path to the input file containing data in the source format, or a quoted glob
+    pattern matching several input files. A glob pattern is always converted as a
+    batch, even when it matches a single file
 mode : str
     Conversion mode in the format 'from2to' (e.g., 'xml2json', 'json2yaml')
 output_file : str, optional
     Path to the output file. If not provided, output is written to stdout
+--out-dir : str, optional
+    Directory for batch output files, each named after its input with the target
+    format as extension. Defaults to each input file's directory
+--jobs : int, optional
+    Number of worker processes for batch conversion. Defaults to the CPU count
 
 Return value
 ------------
@@ -40,12 +48,30 @@ Convert JSON to YAML and output to stdout::
 
     python data_converter.py data.json json2yaml
 
+Convert every XML file in a directory to JSON using four worker processes::
+
+    python data_converter.py "data/*.xml" xml2json --out-dir out/ --jobs 4
+
 Notes
 -----
-- XML conversion uses xmltodict for dictionary-based parsing
+- XML parsing uses xmltodict for dictionary-based parsing. XML output uses lxml
+  when it is installed, producing the same layout xmltodict.unparse reads, and
+  falls back to xmltodict otherwise
+- JSON parsing and serialization use orjson when it is installed, falling back to
+  the standard library json module otherwise. orjson only handles 64-bit integers,
+  so input with long digit runs is parsed, and data orjson cannot serialize is
+  written, with the json module
 - JSON output is formatted with 2-space indentation
-- YAML output uses default block style formatting
+- YAML output uses block style formatting, keeps keys in source order, and writes
+  non-ASCII characters as-is
+- YAML parsing and serialization use the libyaml C bindings when PyYAML was built
+  with them, falling back to the pure-Python implementations otherwise
 - Input files must be valid in their respective formats
+- Set ``DC_CACHE=1`` in the environment to cache parsed XML and YAML input across
+  runs, in a size-bounded per-user directory under /dev/shm (or the system temp
+  directory). Entries are keyed on the input's path and checked against its
+  modification time and size, and are only stored when loading them back is
+  faster than parsing the input again
 
 Raises
 ------
@@ -62,13 +88,23 @@ xmltodict.expat.ExpatError
 """
 
 import argparse
+import functools
+import glob
+import hashlib
 import json
+import math
+import os
+import pickle
+import re
 import signal
+import stat
 import sys
-import traceback
-from collections import OrderedDict
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO, TextIOWrapper
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable, Iterator
 
 try:
     # Try to import non-standard libraries, send a list of libraries if any aren't
@@ -92,27 +128,110 @@ except ImportError as import_err:
         print(mod)
     sys.exit()
 
+try:
+    # orjson is optional; it is used for faster JSON parsing and serialization.
+    import orjson
+
+    ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+    ORJSON_OPTIONS = 0
+
+try:
+    # lxml is optional; it is used for faster XML serialization.
+    from lxml import etree
+except ImportError:
+    etree = None
+
+try:
+    # Prefer the libyaml C bindings; they are only present if PyYAML was built with
+    # libyaml available.
+    from yaml import CLoader as YamlUnsafeLoader
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import Loader as YamlUnsafeLoader
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
 MODE_SEPARATOR = "2"
 EXPECTED_PARTS = 2
+SUPPORTED_FORMATS = ("xml", "json", "yaml")
+MODE_PATTERN = re.compile(r"(xml|json|yaml)2(xml|json|yaml)")
+# A run of this many digits may be an integer outside orjson's 64-bit range
+LONG_DIGITS_PATTERN = re.compile(rb"\d{19}")
+# Characters xmltodict.unparse (and XML) reject in element and attribute names
+XML_NAME_PATTERN = re.compile(r"[^\s<>/'\"=&?!][^\s<>/'\"=&]*")
+CACHE_ENV_VAR = "DC_CACHE"
+SHARED_CACHE_ROOT = Path("/dev/shm")
+# Total size of the shared cache directory before old entries are evicted
+SHARED_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# How much faster than parsing a cache hit must be for a parse to be stored
+CACHE_MIN_SPEEDUP = 2
+# Keyword arguments for every yaml.dump call, built once. Keys keep their source
+# order, and the wide line width avoids re-wrapping long scalars.
+YAML_DUMP_OPTIONS: dict[str, Any] = {
+    "Dumper": YamlDumper,
+    "default_flow_style": False,
+    "sort_keys": False,
+    "allow_unicode": True,
+    "width": 4096,
+}
+
+
+def _clean_string(data: str) -> str:
+    """Strip trailing whitespace from every line of a string and from its end.
+
+    :param data: The string to clean
+
+    :returns: Cleaned string, or the original object when nothing needed stripping
+    """
+    if "\n" not in data:
+        # str.rstrip returns the same object when there is nothing to strip
+        return data.rstrip()
+    # Stripped line by line: a regex for trailing whitespace backtracks through
+    # every long whitespace run and takes quadratic time
+    cleaned = "\n".join([line.rstrip() for line in data.split("\n")]).rstrip()
+    return data if cleaned == data else cleaned
 
 
 def clean_data_for_yaml(data: Any) -> Any:
-    """Recursively clean data for YAML output by converting OrderedDict to dict and cleaning strings.
+    """Clean data for YAML output by converting OrderedDict to dict and cleaning strings.
+
+    The tree is walked iteratively with an explicit stack, so deeply nested data
+    cannot hit the recursion limit. Lists and plain dicts are updated in place;
+    other mappings (e.g. OrderedDict) are copied into plain dicts.
 
     :param data: The data to clean
 
     :returns: Cleaned data suitable for YAML serialization
     """
-    if isinstance(data, (OrderedDict, dict)):
-        return {key: clean_data_for_yaml(value) for key, value in data.items()}
-    if isinstance(data, list):
-        return [clean_data_for_yaml(item) for item in data]
-    if isinstance(data, str):
-        # Strip trailing newlines and normalize whitespace in multiline strings
-        lines = data.rstrip("\n").split("\n")
-        cleaned_lines = [line.rstrip() for line in lines]
-        return "\n".join(cleaned_lines).rstrip()
-    return data
+    root = [data]
+    stack: list[Any] = [root]
+    # Containers already handled, keyed by id, so shared and recursive references
+    # (e.g. YAML anchors) are converted once and keep pointing at the same object.
+    seen: dict[int, tuple[Any, Any]] = {id(root): (root, root)}
+
+    while stack:
+        node = stack.pop()
+        slots = node.items() if type(node) is dict else enumerate(node)
+        for key, value in slots:
+            if isinstance(value, str):
+                cleaned = _clean_string(value)
+                if cleaned is not value:
+                    node[key] = cleaned
+            elif isinstance(value, (dict, list)):
+                done = seen.get(id(value))
+                if done is not None:
+                    if done[1] is not value:
+                        node[key] = done[1]
+                    continue
+                converted = value
+                if isinstance(value, dict) and type(value) is not dict:
+                    converted = node[key] = dict(value)
+                seen[id(value)] = (value, converted)
+                stack.append(converted)
+    return root[0]
 
 
 def parse_mode(mode: str) -> tuple[str, str]:
@@ -125,6 +244,13 @@ def parse_mode(mode: str) -> tuple[str, str]:
     :raises ValueError:
         When mode format is invalid or unsupported formats are specified
     """
+    match = MODE_PATTERN.fullmatch(mode)
+    if match is not None:
+        from_fmt, to_fmt = match.groups()
+        if from_fmt != to_fmt:
+            return from_fmt, to_fmt
+
+    # Invalid mode: work out which part is wrong to report it
     if MODE_SEPARATOR not in mode:
         msg = (
             f"Invalid mode format: {mode}. Expected format: 'from2to' (e.g., 'xml2json')"
@@ -137,46 +263,326 @@ def parse_mode(mode: str) -> tuple[str, str]:
         raise ValueError(msg)
 
     from_fmt, to_fmt = parts
-    supported_formats = ["xml", "json", "yaml"]
 
-    if from_fmt not in supported_formats:
-        msg = f"Unsupported source format: {from_fmt}. Supported: {', '.join(supported_formats)}"
+    if from_fmt not in SUPPORTED_FORMATS:
+        msg = f"Unsupported source format: {from_fmt}. Supported: {', '.join(SUPPORTED_FORMATS)}"
         raise ValueError(msg)
 
-    if to_fmt not in supported_formats:
-        msg = f"Unsupported target format: {to_fmt}. Supported: {', '.join(supported_formats)}"
+    if to_fmt not in SUPPORTED_FORMATS:
+        msg = f"Unsupported target format: {to_fmt}. Supported: {', '.join(SUPPORTED_FORMATS)}"
         raise ValueError(msg)
 
-    if from_fmt == to_fmt:
-        msg = f"Source and target formats are the same: {from_fmt}"
-        raise ValueError(msg)
+    msg = f"Source and target formats are the same: {from_fmt}"
+    raise ValueError(msg)
 
-    return from_fmt, to_fmt
 
+def read_input_file(input_file: str) -> bytes:
+    """Read the raw content of the input file.
 
-def read_input_file(input_file: str) -> str:
-    """Read the content of the input file.
+    The content is returned undecoded; every supported parser accepts bytes.
 
     :param input_file: Path to the input file
 
-    :returns: Content of the file as a string
+    :returns: Content of the file as bytes
 
     :raises FileNotFoundError:
         When the input file does not exist
     """
-    input_path = Path(input_file)
-    if not input_path.is_file():
+    try:
+        with open(input_file, "rb", buffering=-1) as f:
+            return f.read()
+    except FileNotFoundError as e:
         msg = f"Input file not found: {input_file}"
-        raise FileNotFoundError(msg)
+        raise FileNotFoundError(msg) from e
+
+
+def _xml_text(value: Any) -> str:
+    """Render a scalar value as XML text the same way xmltodict.unparse does.
+
+    :param value: Scalar value to render
+
+    :returns: Text representation of the value; None renders as an empty string
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return bytes(value).decode("utf-8", errors="replace")
+    return str(value)
+
+
+def _xml_name(name: Any, kind: str) -> str:
+    """Check that a name can be written as an XML element or attribute name.
+
+    etree.xmlfile writes names as given, so this rejects the same names
+    xmltodict.unparse does (and "&"), which would otherwise produce malformed XML.
+
+    :param name: Element or attribute name
+    :param kind: 'element' or 'attribute', for the error message
 
-    with input_path.open(encoding="utf-8") as f:
-        return f.read()
+    :returns: The name
 
+    :raises ValueError:
+        When the name is not a string or contains characters not allowed in names
+    """
+    if not isinstance(name, str) or not XML_NAME_PATTERN.fullmatch(name):
+        msg = f"Invalid XML {kind} name: {name!r}"
+        raise ValueError(msg)
+    return name
+
+
+def _write_xml_element(xf: Any, name: Any, value: Any, depth: int) -> None:
+    """Write an element (and its children) from an xmltodict-style value to an xmlfile.
+
+    Names, namespace prefixes and xmlns attributes are written literally, as
+    xmltodict.unparse does, so the output parses back to the same keys. Output is
+    indented like lxml's pretty_print: the children of an element are only put on
+    their own lines when it has no text of its own.
+
+    :param xf: Open etree.xmlfile writer
+    :param name: Element name, including any namespace prefix
+    :param value: Element value: a dict of attributes/children, a scalar, or None
+    :param depth: Nesting depth of the element, 0 for the root
+
+    :returns: None
+
+    :raises ValueError:
+        When an element or attribute name is invalid, or a comment contains "--"
+    """
+    tag = _xml_name(name, "element")
+    attrs: dict[str, str] = {}
+    text = None
+    children: list[tuple[Any, Any]] = []
+    if isinstance(value, dict):
+        for key, child in value.items():
+            if isinstance(key, str) and key.startswith("@"):
+                if key == "@xmlns" and isinstance(child, dict):
+                    # Namespace declarations given as a prefix to URI mapping
+                    for prefix, uri in child.items():
+                        attr = f"xmlns:{prefix}" if prefix else "xmlns"
+                        attrs[_xml_name(attr, "attribute")] = _xml_text(uri)
+                else:
+                    attrs[_xml_name(key[1:], "attribute")] = _xml_text(child)
+            elif key == "#text":
+                if child is not None:
+                    text = _xml_text(child)
+            else:
+                for item in child if isinstance(child, list) else [child]:
+                    # Written like xmltodict.unparse does; empty comments are skipped
+                    if key != "#comment" or _xml_text(item):
+                        children.append((key, item))
+    elif value is not None:
+        text = _xml_text(value)
+
+    indent = "\n" + "  " * (depth + 1) if children and not text else None
+    with xf.element(tag, attrs):
+        if text is not None:
+            xf.write(text)
+        for key, item in children:
+            if indent:
+                xf.write(indent)
+            if key == "#comment":
+                xf.write(etree.Comment(_xml_text(item)))
+            else:
+                _write_xml_element(xf, key, item, depth + 1)
+        if indent:
+            xf.write(indent[:-2])
+
+
+def write_xml(data: Any, stream: BinaryIO) -> None:
+    """Write data in the layout produced by xmltodict.parse as XML with lxml.
+
+    Elements are written to the stream one at a time with etree.xmlfile, so no
+    element tree for the whole document is built in memory.
+
+    :param data: Dict with a single key naming the root element
+    :param stream: Binary file object the UTF-8 encoded XML is written to
+
+    :returns: None
+
+    :raises ValueError:
+        When the data does not have exactly one root element, or holds an invalid
+        element or attribute name
+    """
+    if not isinstance(data, dict) or len(data) != 1:
+        msg = "Document must have exactly one root."
+        raise ValueError(msg)
+    ((name, value),) = data.items()
+    if isinstance(value, list):
+        if len(value) != 1:
+            msg = "Document must have exactly one root."
+            raise ValueError(msg)
+        value = value[0]
+    # xmlfile rejects text outside the root element, so the declaration and the
+    # final newline are written to the stream directly
+    stream.write(b"<?xml version='1.0' encoding='UTF-8'?>\n")
+    with etree.xmlfile(stream, encoding="utf-8") as xf:
+        _write_xml_element(xf, name, value, 0)
+    stream.write(b"\n")
+
+
+def load_yaml(content: bytes | str) -> Any:
+    """Parse YAML content, falling back to the unsafe loader for Python objects.
+
+    :param content: YAML document as bytes or a string
+
+    :returns: Parsed data
+
+    :raises yaml.YAMLError:
+        When YAML input is malformed
+    """
+    try:
+        return yaml.load(content, Loader=YamlLoader)
+    except yaml.YAMLError:
+        # Fallback to unsafe loader for YAML with Python objects
+        return yaml.load(content, Loader=YamlUnsafeLoader)
 
-def load_data(content: str, from_fmt: str) -> Any:
-    """Load data from string content based on the source format.
 
-    :param content: String content of the input data
+def _dump_xml_lxml(data: Any) -> bytes:
+    """Serialize data to XML bytes with lxml."""
+    buffer = BytesIO()
+    write_xml(data, buffer)
+    return buffer.getvalue()
+
+
+def _dump_xml_xmltodict(data: Any) -> str:
+    """Serialize data to an XML string with xmltodict."""
+    # xmltodict.unparse may be typed as returning Any by some type stubs,
+    # so explicitly ensure we return a str for the declared return type.
+    return str(xmltodict.unparse(data))
+
+
+def dump_yaml(data: Any, stream: BinaryIO | None = None) -> str | None:
+    """Serialize data to YAML using the module's standard dump options.
+
+    The data should already have been passed through clean_data_for_yaml.
+
+    :param data: Data to serialize
+    :param stream: Binary stream to write UTF-8 encoded YAML to, or None
+
+    :returns: YAML string when no stream is given, otherwise None
+    """
+    if stream is None:
+        return yaml.dump(data, **YAML_DUMP_OPTIONS)
+    yaml.dump(data, stream, encoding="utf-8", **YAML_DUMP_OPTIONS)
+    return None
+
+
+def _write_xml_xmltodict(data: Any, stream: BinaryIO) -> None:
+    """Serialize data as XML into a binary stream with xmltodict."""
+    xmltodict.unparse(data, output=stream, encoding="utf-8")
+
+
+def _load_json_orjson(content: bytes | str) -> Any:
+    """Parse JSON with orjson, or with the json module where orjson differs from it."""
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    # orjson turns integers beyond 64 bits into floats, losing precision
+    if LONG_DIGITS_PATTERN.search(content):
+        return json.loads(content)
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        # orjson rejects NaN, Infinity, out of range numbers such as 1e400 and lone
+        # surrogate escapes, which the json module accepts; input that is really
+        # malformed raises the json module's error
+        return json.loads(content)
+
+
+def _has_non_finite_float(data: Any) -> bool:
+    """Return whether data holds a NaN or infinite float anywhere.
+
+    :param data: Data to search, which must not contain reference cycles
+
+    :returns: True when any float in the data is NaN or infinite
+    """
+    isfinite = math.isfinite
+    stack = [[data]]
+    while stack:
+        node = stack.pop()
+        for value in node.values() if isinstance(node, dict) else node:
+            if isinstance(value, float):
+                if not isfinite(value):
+                    return True
+            elif isinstance(value, (dict, list, tuple)):
+                stack.append(value)
+    return False
+
+
+def _orjson_dumps(data: Any) -> bytes | None:
+    """Serialize data to JSON with orjson, or return None if the json module must.
+
+    :param data: Data to serialize
+
+    :returns: JSON bytes, or None when orjson cannot serialize the data the way the
+        json module does
+    """
+    try:
+        output = orjson.dumps(data, option=ORJSON_OPTIONS)
+    except orjson.JSONEncodeError:
+        # e.g. integers beyond 64 bits or lone surrogates, which the json module
+        # handles
+        return None
+    # orjson writes NaN and infinities as null where the json module writes NaN and
+    # Infinity; only output containing null can be affected
+    if b"null" in output and _has_non_finite_float(data):
+        return None
+    return output
+
+
+def _dump_json_orjson(data: Any) -> bytes | str:
+    """Serialize data to JSON with orjson, falling back to the json module."""
+    output = _orjson_dumps(data)
+    if output is None:
+        return json.dumps(data, indent=2)
+    return output
+
+
+def _write_json_orjson(data: Any, stream: BinaryIO) -> None:
+    """Serialize data as JSON into a binary stream with orjson."""
+    output = _orjson_dumps(data)
+    if output is None:
+        _write_json_stdlib(data, stream)
+        return
+    stream.write(output)
+
+
+def _write_json_stdlib(data: Any, stream: BinaryIO) -> None:
+    """Serialize data as JSON into a binary stream with the json module."""
+    text_stream = TextIOWrapper(stream, encoding="utf-8")
+    json.dump(data, text_stream, indent=2)
+    text_stream.flush()
+    # Detach so closing the wrapper later does not close the caller's stream
+    text_stream.detach()
+
+
+# Per-format handlers, with the fastest available backend chosen once at import
+_LOADERS: dict[str, Callable[[bytes | str], Any]] = {
+    "xml": functools.partial(xmltodict.parse, dict_constructor=dict),
+    "json": _load_json_orjson if orjson is not None else json.loads,
+    "yaml": load_yaml,
+}
+_DUMPERS: dict[str, Callable[[Any], bytes | str]] = {
+    "xml": _dump_xml_lxml if etree is not None else _dump_xml_xmltodict,
+    "json": (
+        _dump_json_orjson
+        if orjson is not None
+        else functools.partial(json.dumps, indent=2)
+    ),
+    "yaml": dump_yaml,
+}
+_WRITERS: dict[str, Callable[[Any, BinaryIO], None]] = {
+    "xml": write_xml if etree is not None else _write_xml_xmltodict,
+    "json": _write_json_orjson if orjson is not None else _write_json_stdlib,
+    "yaml": dump_yaml,
+}
+
+
+def load_data(content: bytes | str, from_fmt: str) -> Any:
+    """Load data from raw content based on the source format.
+
+    :param content: Content of the input data as bytes or a string
     :param from_fmt: Source format ('xml', 'json', or 'yaml')
 
     :returns: Parsed data which may be a dict, list, or primitive depending on the input
@@ -184,74 +590,469 @@ def load_data(content: str, from_fmt: str) -> Any:
     :raises ValueError:
         When source format is unexpected
     :raises json.JSONDecodeError:
-        When JSON input is malformed
+        When JSON input is malformed (orjson.JSONDecodeError is a subclass)
     :raises yaml.YAMLError:
         When YAML input is malformed
     :raises xmltodict.expat.ExpatError:
         When XML input is malformed
     """
-    if from_fmt == "xml":
-        return xmltodict.parse(content)
-    if from_fmt == "json":
-        return json.loads(content)
-    if from_fmt == "yaml":
+    try:
+        loader = _LOADERS[from_fmt]
+    except KeyError as e:
+        msg = f"Unexpected source format: {from_fmt}"
+        raise ValueError(msg) from e
+    return loader(content)
+
+
+def _shared_cache_file(input_path: str, from_fmt: str) -> Path | None:
+    """Return the cross-process cache file for an input, creating its directory.
+
+    The cache directory is private to the current user; it is not used if it is
+    not owned by the user or is accessible to anyone else, since cached entries
+    are unpickled.
+
+    :param input_path: Absolute path to the input file
+    :param from_fmt: Source format the input is parsed as
+
+    :returns: Path to the cache file, or None when no safe cache directory exists
+    """
+    if not hasattr(os, "getuid"):
+        return None
+    root = SHARED_CACHE_ROOT
+    if not root.is_dir():
+        root = Path(tempfile.gettempdir())
+    cache_dir = root / f"data_converter-{os.getuid()}"
+    try:
+        cache_dir.mkdir(mode=0o700, exist_ok=True)
+        dir_stat = cache_dir.lstat()
+    except OSError:
+        return None
+    if (
+        not stat.S_ISDIR(dir_stat.st_mode)
+        or dir_stat.st_uid != os.getuid()
+        or dir_stat.st_mode & 0o077
+    ):
+        return None
+    digest = hashlib.sha256(f"{from_fmt}\0{input_path}".encode()).hexdigest()[:32]
+    return cache_dir / f"data_converter_{digest}.pkl"
+
+
+def _evict_shared_cache(cache_dir: Path, keep: Path) -> None:
+    """Delete least recently used cache entries until they fit SHARED_CACHE_MAX_BYTES.
+
+    :param cache_dir: Cache directory to trim
+    :param keep: Cache file that was just written, which is never deleted
+
+    :returns: None
+    """
+    entries = []
+    total = 0
+    for entry in cache_dir.glob("data_converter_*.pkl"):
+        try:
+            entry_stat = entry.stat()
+        except OSError:
+            continue
+        entries.append((entry_stat.st_mtime_ns, entry_stat.st_size, entry))
+        total += entry_stat.st_size
+
+    # Hits refresh an entry's mtime, so the oldest mtime is the least recently used
+    entries.sort()
+    for _, size, entry in entries:
+        if total <= SHARED_CACHE_MAX_BYTES:
+            break
+        if entry == keep:
+            continue
         try:
-            return yaml.safe_load(content)
-        except yaml.YAMLError:
-            # Fallback to unsafe loader for YAML with Python objects
-            return yaml.load(content, Loader=yaml.Loader)
+            entry.unlink()
+        except OSError:
+            continue
+        total -= size
 
-    msg = f"Unexpected source format: {from_fmt}"
-    raise ValueError(msg)
 
+def _store_shared_cache(
+    cache_file: Path, stamp: bytes, data: Any, parse_seconds: float
+) -> None:
+    """Store parsed data in the shared cache if loading it back beats parsing again.
+
+    :param cache_file: Cache file to write
+    :param stamp: First line of the cache file, identifying the input version
+    :param data: Parsed data to store
+    :param parse_seconds: Time it took to read and parse the input
+
+    :returns: None
+    """
+    try:
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        # Objects built by the unsafe YAML loader are not always picklable
+        return
+    if len(stamp) + len(payload) > SHARED_CACHE_MAX_BYTES:
+        return
+
+    start = time.perf_counter()
+    pickle.loads(payload)
+    if (time.perf_counter() - start) * CACHE_MIN_SPEEDUP > parse_seconds:
+        return
+
+    tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_file.open("wb") as f:
+            f.write(stamp)
+            f.write(payload)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        tmp_file.unlink(missing_ok=True)
+        return
+    _evict_shared_cache(cache_file.parent, cache_file)
 
-def convert_data(data: Any, to_fmt: str) -> str:
-    """Convert parsed data to the target format string.
+
+def load_input(input_file: str, from_fmt: str) -> Any:
+    """Read and parse the input file, reusing a cached parse when it is unchanged.
+
+    Caching is opt-in: it is only used when the DC_CACHE environment variable is
+    set to 1. Entries live in a shared per-user directory, keyed on the input's
+    path and format and validated against its modification time and size. A parse
+    is only stored when loading it back is at least CACHE_MIN_SPEEDUP times faster
+    than parsing, which rules out JSON, so JSON input is never cached.
+
+    :param input_file: Path to the input file
+    :param from_fmt: Source format ('xml', 'json', or 'yaml')
+
+    :returns: Parsed data which may be a dict, list, or primitive depending on the input
+
+    :raises FileNotFoundError:
+        When the input file does not exist
+    """
+    if os.environ.get(CACHE_ENV_VAR) != "1" or from_fmt == "json":
+        return load_data(read_input_file(input_file), from_fmt)
+
+    try:
+        input_stat = os.stat(input_file)
+    except FileNotFoundError as e:
+        msg = f"Input file not found: {input_file}"
+        raise FileNotFoundError(msg) from e
+
+    cache_file = _shared_cache_file(os.path.abspath(input_file), from_fmt)
+    if cache_file is None:
+        return load_data(read_input_file(input_file), from_fmt)
+
+    stamp = f"{input_stat.st_mtime_ns} {input_stat.st_size}\n".encode()
+    try:
+        with cache_file.open("rb") as f:
+            if f.readline() == stamp:
+                data = pickle.loads(f.read())
+                # Mark the entry as recently used for eviction
+                os.utime(cache_file)
+                return data
+    except Exception:
+        # A missing, unreadable or corrupt entry is treated as a cache miss
+        pass
+
+    start = time.perf_counter()
+    data = load_data(read_input_file(input_file), from_fmt)
+    _store_shared_cache(cache_file, stamp, data, time.perf_counter() - start)
+    return data
+
+
+def convert_data(data: Any, to_fmt: str) -> bytes | str:
+    """Convert parsed data to the target format.
 
     :param data: Parsed data (dict, list, or primitive) to convert
     :param to_fmt: Target format ('xml', 'json', or 'yaml')
 
-    :returns: Converted data as a string
+    :returns: Converted data, as UTF-8 bytes when the serializer produces them
+        natively (orjson, lxml) and as a string otherwise
 
     :raises ValueError:
         When target format is unexpected
     """
-    if to_fmt == "xml":
-        # xmltodict.unparse may be typed as returning Any by some type stubs,
-        # so explicitly ensure we return a str for the declared return type.
-        return str(xmltodict.unparse(data))
-    if to_fmt == "json":
-        return json.dumps(data, indent=2)
+    try:
+        dumper = _DUMPERS[to_fmt]
+    except KeyError as e:
+        msg = f"Unexpected target format: {to_fmt}"
+        raise ValueError(msg) from e
     if to_fmt == "yaml":
         # Convert OrderedDict to dict and clean strings for clean YAML output
-        clean_data = clean_data_for_yaml(data)
-        return yaml.dump(clean_data)
+        data = clean_data_for_yaml(data)
+    return dumper(data)
 
-    msg = f"Unexpected target format: {to_fmt}"
-    raise ValueError(msg)
 
+def convert_data_stream(data: Any, to_fmt: str, stream: BinaryIO) -> None:
+    """Convert parsed data to the target format and write it straight to a stream.
+
+    Unlike convert_data, the XML and YAML serializers write into the stream as
+    they go, so neither the full output nor (for XML) a document tree is held in
+    memory. orjson still builds its output in one piece, but as bytes rather than
+    a string.
+
+    :param data: Parsed data (dict, list, or primitive) to convert
+    :param to_fmt: Target format ('xml', 'json', or 'yaml')
+    :param stream: Binary file object the UTF-8 encoded output is written to
+
+    :returns: None
+
+    :raises ValueError:
+        When target format is unexpected
+    """
+    try:
+        writer = _WRITERS[to_fmt]
+    except KeyError as e:
+        msg = f"Unexpected target format: {to_fmt}"
+        raise ValueError(msg) from e
+    if to_fmt == "yaml":
+        # Convert OrderedDict to dict and clean strings for clean YAML output
+        data = clean_data_for_yaml(data)
+    writer(data, stream)
 
-def write_output(output: str, output_file: str | None) -> None:
+
+def write_output(output: bytes | str, output_file: str | None) -> None:
     """Write the output to file or stdout.
 
-    :param output: Output string to write
+    :param output: Output to write, as UTF-8 bytes or a string
     :param output_file: Path to output file, or None for stdout
 
     :returns: None
     """
     if output_file:
         output_path = Path(output_file)
-        with output_path.open("w", encoding="utf-8") as f:
-            f.write(output)
+        with output_path.open("wb") as f:
+            f.write(output if isinstance(output, bytes) else output.encode("utf-8"))
         print(f"Conversion complete. Output written to {output_file}")
     else:
-        print(output)
+        # Write bytes straight to the binary buffer in one call instead of going
+        # through print and the line-buffered text layer
+        stdout = sys.stdout.buffer
+        sys.stdout.flush()
+        stdout.write(output if isinstance(output, bytes) else output.encode("utf-8"))
+        stdout.write(b"\n")
+        stdout.flush()
+
+
+def _new_file_mode() -> int:
+    """Return the permission bits open() gives a newly created file."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
+def _write_output_file(
+    data: Any,
+    output_file: str,
+    writer: Callable[[Any, BinaryIO], None],
+    dumper: Callable[[Any], bytes | str],
+) -> None:
+    """Serialize data into an output file, replacing it only once writing succeeded.
+
+    The writer streams into a temporary file next to the (symlink-resolved) target,
+    which then replaces it, so a failed conversion leaves an existing output file
+    untouched and only the temporary file is removed. Outputs that are not regular
+    files (e.g. a FIFO) or live in /dev (e.g. /dev/stdout, even when redirected to
+    a file) cannot be replaced, so the data is fully serialized with the dumper
+    first and then written to them.
+
+    :param data: Data to serialize
+    :param output_file: Path to the output file
+    :param writer: Serializer writing into a binary stream
+    :param dumper: Serializer returning the whole output
+
+    :returns: None
+    """
+    output_path = Path(output_file)
+    try:
+        mode: int | None = output_path.stat().st_mode
+    except FileNotFoundError:
+        mode = None
+    if (mode is not None and not stat.S_ISREG(mode)) or (
+        output_path.absolute().parts[1:2] == ("dev",)
+    ):
+        output = dumper(data)
+        with output_path.open("wb") as f:
+            f.write(output if isinstance(output, bytes) else output.encode("utf-8"))
+        return
+
+    path = output_path.resolve()
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{path.name}.", suffix=".tmp", dir=path.parent
+    )
+    tmp_path = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            writer(data, f)
+        # mkstemp creates the file private to the user, so give it the mode the
+        # output file has, or would get when created by open()
+        os.chmod(tmp_path, stat.S_IMODE(mode) if mode is not None else _new_file_mode())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+@functools.lru_cache(maxsize=9)
+def make_pipeline(from_fmt: str, to_fmt: str) -> Callable[[str, str | None], None]:
+    """Build a converter specialized for one source and target format pair.
+
+    The serializers and whether the data needs cleaning for YAML are resolved
+    once here, so converting many files with the same mode does no per-file
+    format dispatch.
+
+    :param from_fmt: Source format ('xml', 'json', or 'yaml')
+    :param to_fmt: Target format ('xml', 'json', or 'yaml')
+
+    :returns: Function taking an input file path and an output file path (or None
+        for stdout) that converts the input and writes the result
+    """
+    dumper = _DUMPERS[to_fmt]
+    writer = _WRITERS[to_fmt]
+    needs_clean = to_fmt == "yaml"
+
+    def pipeline(input_file: str, output_file: str | None) -> None:
+        data = load_input(input_file, from_fmt)
+        if needs_clean:
+            # Convert OrderedDict to dict and clean strings for clean YAML output
+            data = clean_data_for_yaml(data)
+        if not output_file:
+            write_output(dumper(data), None)
+            return
+
+        _write_output_file(data, output_file, writer, dumper)
+
+    return pipeline
+
+
+def is_glob_pattern(input_file: str) -> bool:
+    """Return whether the input argument is expanded as a glob pattern.
+
+    An existing path is always taken literally, so file names containing glob
+    characters such as '[' still work.
+
+    :param input_file: Path to an input file, or a glob pattern
+
+    :returns: True when the argument is not an existing path and has glob characters
+    """
+    return not os.path.exists(input_file) and glob.escape(input_file) != input_file
+
+
+def expand_input_files(input_file: str) -> list[str]:
+    """Expand the input argument into the list of files to convert.
+
+    :param input_file: Path to an input file, or a glob pattern (see is_glob_pattern)
+
+    :returns: The path itself, or the sorted paths matching the glob pattern
+
+    :raises FileNotFoundError:
+        When a glob pattern matches no files
+    """
+    if not is_glob_pattern(input_file):
+        return [input_file]
+    input_files = sorted(path for path in glob.glob(input_file) if Path(path).is_file())
+    if not input_files:
+        msg = f"No input files match: {input_file}"
+        raise FileNotFoundError(msg)
+    return input_files
+
+
+def batch_output_file(input_file: str, to_fmt: str, out_dir: str | None) -> str:
+    """Return the output path for one file of a batch conversion.
+
+    :param input_file: Path to the input file
+    :param to_fmt: Target format, used as the output file extension
+    :param out_dir: Output directory, or None to write next to the input file
+
+    :returns: Path to the output file
+    """
+    input_path = Path(input_file)
+    output_dir = Path(out_dir) if out_dir else input_path.parent
+    return str(output_dir / f"{input_path.stem}.{to_fmt}")
+
+
+def _innermost_lineno(e: BaseException) -> int | None:
+    """Return the line number of the innermost traceback frame of an exception.
+
+    :param e: The exception to inspect
+
+    :returns: Line number the exception was raised at, or None without a traceback
+    """
+    tb = e.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
+    return tb.tb_lineno if tb is not None else None
+
+
+def _convert_one(
+    task: tuple[str, str, str, str],
+) -> tuple[str, Exception | None, int | None]:
+    """Convert a single file of a batch; module level so worker processes can run it.
+
+    Errors are returned rather than raised: exceptions pickled back from a worker
+    lose their traceback, and some (e.g. ``JSONDecodeError``) also lose any notes
+    or attributes, so convert_files annotates and raises them in the main process.
+
+    :param task: Tuple of (input_file, from_fmt, to_fmt, output_file)
+
+    :returns: Tuple of (output_file, error or None, line the error was raised at)
+    """
+    input_file, from_fmt, to_fmt, output_file = task
+    try:
+        make_pipeline(from_fmt, to_fmt)(input_file, output_file)
+    except Exception as e:
+        lineno = _innermost_lineno(e)
+        try:
+            pickle.dumps(e)
+        except Exception:
+            # Some exceptions (e.g. those holding parser objects) cannot be pickled
+            return output_file, RuntimeError(f"{e.__class__.__name__}: {e}"), lineno
+        return output_file, e, lineno
+    return output_file, None, None
+
+
+def convert_files(tasks: list[tuple[str, str, str, str]], jobs: int) -> Iterator[str]:
+    """Convert a batch of files, in parallel worker processes when worthwhile.
+
+    :param tasks: Tuples of (input_file, from_fmt, to_fmt, output_file)
+    :param jobs: Maximum number of worker processes
+
+    :returns: Iterator over the written output files, in task order
+
+    :raises Exception: The first error raised while converting a file, noting the
+        input file and with ``worker_lineno`` set to the line it was raised at
+    """
+    if jobs <= 1 or len(tasks) <= 1:
+        results = map(_convert_one, tasks)
+        yield from _raise_first_error(tasks, results)
+        return
+
+    workers = min(jobs, len(tasks))
+    # Send several files per round trip to the workers to amortize IPC overhead
+    chunksize = max(1, len(tasks) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(_convert_one, tasks, chunksize=chunksize)
+        yield from _raise_first_error(tasks, results)
+
+
+def _raise_first_error(
+    tasks: list[tuple[str, str, str, str]],
+    results: Iterator[tuple[str, Exception | None, int | None]],
+) -> Iterator[str]:
+    """Yield the output files of a batch, raising the first conversion error.
+
+    :param tasks: Tuples of (input_file, from_fmt, to_fmt, output_file)
+    :param results: Results of _convert_one for each task, in task order
+
+    :returns: Iterator over the written output files, in task order
+    """
+    for task, (output_file, error, lineno) in zip(tasks, results):
+        if error is not None:
+            error.add_note(f"While converting input file: {task[0]}")
+            error.worker_lineno = lineno
+            raise error
+        yield output_file
 
 
 def sub_main(args: argparse.Namespace) -> None:
     """Convert data between XML, JSON, and YAML formats.
 
-    :param args: Parsed command-line arguments containing input_file, mode, and output_file
+    :param args: Parsed command-line arguments containing input_file, mode,
+        output_file, out_dir and jobs
 
     :returns: None
         This function does not return a value; it writes output to file or stdout.
@@ -270,12 +1071,40 @@ def sub_main(args: argparse.Namespace) -> None:
     input_file: str = args.input_file
     mode: str = args.mode
     output_file: str | None = args.output_file
+    out_dir: str | None = args.out_dir
+    jobs: int = args.jobs if args.jobs is not None else os.cpu_count() or 1
 
     from_fmt, to_fmt = parse_mode(mode)
-    content = read_input_file(input_file)
-    data = load_data(content, from_fmt)
-    output = convert_data(data, to_fmt)
-    write_output(output, output_file)
+    input_files = expand_input_files(input_file)
+
+    # A glob pattern is always a batch, so where its output goes does not depend
+    # on how many files it happens to match
+    if not is_glob_pattern(input_file) and not out_dir:
+        make_pipeline(from_fmt, to_fmt)(input_files[0], output_file)
+        if output_file:
+            print(f"Conversion complete. Output written to {output_file}")
+        return
+
+    if output_file:
+        msg = "An output file cannot be given for a batch conversion; use --out-dir"
+        raise ValueError(msg)
+    if jobs < 1:
+        msg = f"Invalid number of jobs: {jobs}. Expected at least 1"
+        raise ValueError(msg)
+
+    tasks = [
+        (path, from_fmt, to_fmt, batch_output_file(path, to_fmt, out_dir))
+        for path in input_files
+    ]
+    output_files = [task[3] for task in tasks]
+    if len(set(output_files)) != len(output_files):
+        msg = "Several input files would be written to the same output file"
+        raise ValueError(msg)
+    if out_dir:
+        Path(out_dir).mkdir(parents=True, exist_ok=True)
+
+    for written_file in convert_files(tasks, jobs):
+        print(f"Conversion complete. Output written to {written_file}")
 
 
 def main() -> None:
@@ -287,7 +1116,10 @@ def main() -> None:
     parser = argparse.ArgumentParser(
         description="Convert data between XML, JSON, and YAML formats"
     )
-    parser.add_argument("input_file", help="Path to the input file to convert")
+    parser.add_argument(
+        "input_file",
+        help="Path to the input file to convert, or a quoted glob pattern for a batch",
+    )
     parser.add_argument(
         "mode",
         help="Conversion mode in format 'from2to' (e.g., xml2json, json2yaml, yaml2xml)",
@@ -297,6 +1129,15 @@ def main() -> None:
         nargs="?",
         help="Path to the output file (optional, defaults to stdout)",
     )
+    parser.add_argument(
+        "--out-dir",
+        help="Directory for batch output files (defaults to each input's directory)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help="Number of worker processes for batch conversion (defaults to CPU count)",
+    )
 
     args = parser.parse_args()
 
@@ -306,14 +1147,13 @@ def main() -> None:
         print("\nKeyboardInterrupt: Program interrupted by user. Exiting gracefully.")
         sys.exit(0)
     except Exception as e:
-        exit_with_error(e, traceback)
+        exit_with_error(e)
 
 
-def exit_with_error(e: Exception, tb_module: Any) -> None:
+def exit_with_error(e: Exception) -> None:
     """Handles exceptions by printing error details and exiting the program.
 
     :param e: The exception instance raised by the program
-    :param tb_module: The traceback module used to extract error information
 
     :returns: None
         This function does not return a value; it terminates the program.
@@ -323,11 +1163,12 @@ def exit_with_error(e: Exception, tb_module: Any) -> None:
         Exits the program with status code 1.
     """
     print("Error raised by sub function:")
-    tbinfo = tb_module.extract_tb(sys.exc_info()[2])
     errclass = e.__class__.__name__
     errmessage = str(e) if str(e) else "no message"
     errnotes = e.__notes__ if hasattr(e, "__notes__") else []
-    errlineno = tbinfo[-1].lineno if tbinfo else "unknown"
+    # Errors from batch worker processes carry the line they were raised at; their
+    # own traceback only covers concurrent.futures internals
+    errlineno = getattr(e, "worker_lineno", None) or _innermost_lineno(e) or "unknown"
     print(f'{errclass}: "{errmessage}" at line {errlineno}')
 
     if errnotes:
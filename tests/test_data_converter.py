@@ -0,0 +1,314 @@
+"""Regression tests for python/data_converter.py."""
+
+import argparse
+import io
+import json
+import pickle
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+xmltodict = pytest.importorskip("xmltodict")
+pytest.importorskip("yaml")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "python"))
+
+import data_converter  # noqa: E402
+
+BIG_INT = 18446744073709551616  # 2**64, one past orjson's range
+HUGE_INT = 123456789012345678901234567890
+
+
+def _text(output: bytes | str) -> str:
+    return output.decode("utf-8") if isinstance(output, bytes) else output
+
+
+def test_json_load_keeps_big_integers_exact() -> None:
+    data = data_converter.load_data(b'{"r": {"id": 18446744073709551616}}', "json")
+    assert data == {"r": {"id": BIG_INT}}
+    assert isinstance(data["r"]["id"], int)
+
+
+def test_json2xml_keeps_big_integers_exact() -> None:
+    data = data_converter.load_data(b'{"r": {"id": 18446744073709551616}}', "json")
+    assert f"<id>{BIG_INT}</id>" in _text(data_converter.convert_data(data, "xml"))
+
+
+def test_json2yaml_keeps_big_integers_exact() -> None:
+    data = data_converter.load_data(f'{{"a": {HUGE_INT}}}'.encode(), "json")
+    assert _text(data_converter.convert_data(data, "yaml")) == f"a: {HUGE_INT}\n"
+
+
+def test_yaml2json_serializes_big_integers() -> None:
+    data = data_converter.load_data(f"a: {HUGE_INT}\n".encode(), "yaml")
+    output = _text(data_converter.convert_data(data, "json"))
+    assert json.loads(output) == {"a": HUGE_INT}
+
+    stream = io.BytesIO()
+    data_converter.convert_data_stream(data, "json", stream)
+    assert json.loads(stream.getvalue()) == {"a": HUGE_INT}
+
+
+def test_xml_load_handles_long_text_and_deep_nesting() -> None:
+    long_text = "x" * (11 * 1024 * 1024)
+    data = data_converter.load_data(f"<r><t>{long_text}</t></r>".encode(), "xml")
+    assert data == {"r": {"t": long_text}}
+
+    depth = 300
+    doc = "<e>" * depth + "v" + "</e>" * depth
+    node = data_converter.load_data(doc.encode(), "xml")
+    for _ in range(depth):
+        node = node["e"]
+    assert node == "v"
+
+
+def test_xml_output_writes_comments() -> None:
+    data = {"r": {"#comment": ["one", "two"], "a": "1", "b": {"#comment": "three"}}}
+    output = _text(data_converter.convert_data(data, "xml"))
+    for comment in ("<!--one-->", "<!--two-->", "<!--three-->"):
+        assert comment in output
+    assert data_converter.load_data(output.encode(), "xml") == {"r": {"a": "1", "b": None}}
+
+
+def test_input_cache_is_opt_in(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(data_converter, "SHARED_CACHE_ROOT", tmp_path / "shm")
+    (tmp_path / "shm").mkdir()
+    input_file = tmp_path / "in.yaml"
+    input_file.write_text("a: [1, 2]\n")
+
+    monkeypatch.delenv("DC_CACHE", raising=False)
+    assert data_converter.load_input(str(input_file), "yaml") == {"a": [1, 2]}
+    assert not any((tmp_path / "shm").iterdir())
+
+
+def test_input_cache_evicts_old_entries(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(data_converter, "SHARED_CACHE_ROOT", tmp_path / "shm")
+    (tmp_path / "shm").mkdir()
+    monkeypatch.setenv("DC_CACHE", "1")
+    # Store every parse regardless of timing, in a cache that fits one entry
+    monkeypatch.setattr(data_converter, "CACHE_MIN_SPEEDUP", 0)
+    input_files = []
+    for name in ("one", "two"):
+        input_file = tmp_path / f"{name}.yaml"
+        input_file.write_text(f"name: {name}\nitems: {list(range(200))}\n")
+        input_files.append(input_file)
+    data = data_converter.load_data(input_files[0].read_bytes(), "yaml")
+    entry_size = len(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)) + 64
+    monkeypatch.setattr(data_converter, "SHARED_CACHE_MAX_BYTES", entry_size * 3 // 2)
+
+    for input_file in input_files:
+        data_converter.load_input(str(input_file), "yaml")
+    cache_files = list((tmp_path / "shm").glob("*/data_converter_*.pkl"))
+    assert len(cache_files) == 1
+
+    # A cache hit returns the same data as a fresh parse
+    data = data_converter.load_input(str(input_files[1]), "yaml")
+    assert data == {"name": "two", "items": list(range(200))}
+
+
+def test_expand_input_files_takes_existing_paths_literally(tmp_path: Path) -> None:
+    input_file = tmp_path / "data[1].json"
+    input_file.write_text('{"a": 1}')
+    (tmp_path / "data1.json").write_text('{"a": 2}')
+    assert data_converter.expand_input_files(str(input_file)) == [str(input_file)]
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_batch_errors_note_input_file_and_worker_line(tmp_path: Path, jobs: int) -> None:
+    tasks = []
+    for name, content in (("good", '{"a": 1}'), ("bad", "{bad")):
+        input_file = tmp_path / f"{name}.json"
+        input_file.write_text(content)
+        tasks.append((str(input_file), "json", "yaml", str(tmp_path / f"{name}.yaml")))
+
+    with pytest.raises(ValueError) as excinfo:
+        list(data_converter.convert_files(tasks, jobs))
+    assert f"While converting input file: {tasks[1][0]}" in excinfo.value.__notes__
+    assert isinstance(excinfo.value.worker_lineno, int)
+
+
+def test_json2yaml_cleans_trailing_whitespace(tmp_path: Path) -> None:
+    data = data_converter.load_data(b'{"a": "x  ", "b": ["y \\nz\\t"]}', "json")
+    expected = "a: x\nb:\n- 'y\n\n  z'\n"
+    assert _text(data_converter.convert_data(data, "yaml")) == expected
+
+    input_file = tmp_path / "in.json"
+    input_file.write_text('{"a": "x  ", "b": ["y \\nz\\t"]}')
+    output_file = tmp_path / "out.yaml"
+    data_converter.make_pipeline("json", "yaml")(str(input_file), str(output_file))
+    assert output_file.read_text() == expected
+
+
+def test_xml_stream_output_matches_dumped_output() -> None:
+    data = {"r": {"@xmlns:p": "urn:p", "p:a": [{"@p:x": "1", "#text": "t"}, None]}}
+    stream = io.BytesIO()
+    data_converter.convert_data_stream(data, "xml", stream)
+    output = data_converter.convert_data(data, "xml")
+    assert stream.getvalue() == (output if isinstance(output, bytes) else output.encode())
+    assert data_converter.load_data(stream.getvalue(), "xml") == {
+        "r": {"@xmlns:p": "urn:p", "p:a": [{"@p:x": "1", "#text": "t"}, None]}
+    }
+
+
+def test_clean_string_strips_each_line() -> None:
+    assert data_converter._clean_string("a  \n\tb\t\r\n c \n\n") == "a\n\tb\n c"
+    value = "a\nb"
+    assert data_converter._clean_string(value) is value
+
+
+def test_clean_string_is_linear_in_whitespace_runs() -> None:
+    value = "x\n" + " " * 200_000 + "y  \n"
+    start = time.perf_counter()
+    cleaned = data_converter._clean_string(value)
+    assert time.perf_counter() - start < 0.5
+    assert cleaned == "x\n" + " " * 200_000 + "y"
+
+
+def test_failed_conversion_keeps_existing_output_file(tmp_path: Path) -> None:
+    input_file = tmp_path / "list.json"
+    input_file.write_text("[1, 2]")
+    output_file = tmp_path / "out.xml"
+    output_file.write_text("precious\n")
+
+    with pytest.raises(ValueError):
+        data_converter.make_pipeline("json", "xml")(str(input_file), str(output_file))
+    assert output_file.read_text() == "precious\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["list.json", "out.xml"]
+
+
+def test_output_file_is_replaced_keeping_mode_and_symlinks(tmp_path: Path) -> None:
+    input_file = tmp_path / "in.json"
+    input_file.write_text('{"a": 1}')
+    output_file = tmp_path / "out.yaml"
+    output_file.write_text("old\n")
+    output_file.chmod(0o600)
+    link = tmp_path / "link.yaml"
+    link.symlink_to(output_file)
+
+    data_converter.make_pipeline("json", "yaml")(str(input_file), str(link))
+    assert link.is_symlink()
+    assert output_file.read_text() == "a: 1\n"
+    assert output_file.stat().st_mode & 0o777 == 0o600
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["in.json", "link.yaml", "out.yaml"]
+
+
+XML_DOCUMENTS = [
+    '<r xmlns:p="urn:p"><p:e/><f xmlns="urn:p"/></r>',
+    '<r xmlns:a="urn:x" xmlns:b="urn:x"><a:e a:k="1"/><b:e b:k="2"/></r>',
+    '<r xmlns="urn:d" xml:lang="en"><a x="&lt;&quot;">1</a><a/><b>t<c>2</c></b></r>',
+    "<r><!--note--><a><b><c>deep</c></b></a><n>&amp;</n></r>",
+]
+
+
+@pytest.mark.parametrize("document", XML_DOCUMENTS)
+def test_xml_output_round_trips_like_xmltodict(document: str) -> None:
+    data = data_converter.load_data(document.encode(), "xml")
+    output = data_converter.convert_data(data, "xml")
+    reference = xmltodict.unparse(data)
+    assert data_converter.load_data(output, "xml") == data
+    assert data_converter.load_data(output, "xml") == data_converter.load_data(
+        reference, "xml"
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"r": {"@a": None, "@b": True, "c": [None, 1.5, False], "d": {"#text": None}}},
+        {"r": {"@xmlns": {"": "urn:d", "p": "urn:p"}, "p:e": "x"}},
+        {"r": {"#comment": [None, ""], "e": []}},
+    ],
+)
+def test_xml_output_matches_xmltodict_values(data: dict) -> None:
+    output = data_converter.convert_data(data, "xml")
+    assert data_converter.load_data(output, "xml") == data_converter.load_data(
+        xmltodict.unparse(data), "xml"
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [{"r": {"a b": "x"}}, {"r": {"@a b": "x"}}, {"r": {"<e": "x"}}, {"r": {1: "x"}}],
+)
+def test_xml_output_rejects_invalid_names_like_xmltodict(data: dict) -> None:
+    with pytest.raises(ValueError):
+        xmltodict.unparse(data)
+    with pytest.raises(ValueError):
+        data_converter.convert_data(data, "xml")
+
+
+def test_clean_data_for_yaml_updates_plain_dicts_in_place() -> None:
+    from collections import OrderedDict
+
+    inner = {"b": "x  "}
+    data = {"a": inner, "c": [inner, OrderedDict(d="y ")]}
+    assert data_converter.clean_data_for_yaml(data) is data
+    assert data == {"a": {"b": "x"}, "c": [{"b": "x"}, {"d": "y"}]}
+    assert data["a"] is inner and data["c"][0] is inner
+    assert type(data["c"][1]) is dict
+
+
+@pytest.mark.parametrize(
+    "document", ['{"a": NaN}', '{"a": 1e400, "b": -Infinity}', '{"a": "\\ud800"}']
+)
+def test_json_load_accepts_what_the_json_module_accepts(document: str) -> None:
+    data = data_converter.load_data(document.encode(), "json")
+    assert json.dumps(data) == json.dumps(json.loads(document))
+
+
+def test_json_load_reports_malformed_input() -> None:
+    with pytest.raises(ValueError):
+        data_converter.load_data(b'{"a": }', "json")
+
+
+def test_yaml2json_keeps_non_finite_floats() -> None:
+    data = data_converter.load_data(b"a: .nan\nb: [.inf, -.inf]\nc: null\n", "yaml")
+    expected = json.dumps(data, indent=2)
+    assert _text(data_converter.convert_data(data, "json")) == expected
+
+    stream = io.BytesIO()
+    data_converter.convert_data_stream(data, "json", stream)
+    assert stream.getvalue().decode() == expected
+
+
+def _batch_args(input_file: str, **kwargs: object) -> argparse.Namespace:
+    options = {"mode": "json2yaml", "output_file": None, "out_dir": None, "jobs": 1}
+    options.update(kwargs)
+    return argparse.Namespace(input_file=input_file, **options)
+
+
+def test_batch_output_file() -> None:
+    assert data_converter.batch_output_file("in/a.json", "yaml", None) == str(
+        Path("in/a.yaml")
+    )
+    assert data_converter.batch_output_file("in/a.b.json", "xml", "out") == str(
+        Path("out/a.b.xml")
+    )
+
+
+def test_glob_matching_one_file_is_a_batch(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    (tmp_path / "a.json").write_text('{"a": 1}')
+    data_converter.sub_main(_batch_args(str(tmp_path / "*.json")))
+    assert (tmp_path / "a.yaml").read_text() == "a: 1\n"
+    assert capsys.readouterr().out == (
+        f"Conversion complete. Output written to {tmp_path / 'a.yaml'}\n"
+    )
+
+    with pytest.raises(ValueError, match="output file cannot be given"):
+        data_converter.sub_main(
+            _batch_args(str(tmp_path / "*.json"), output_file=str(tmp_path / "o.yaml"))
+        )
+
+
+def test_batch_rejects_colliding_output_files(tmp_path: Path) -> None:
+    (tmp_path / "a.json").write_text('{"a": 1}')
+    (tmp_path / "a.txt").write_text('{"a": 2}')
+    with pytest.raises(ValueError, match="same output file"):
+        data_converter.sub_main(_batch_args(str(tmp_path / "a.*")))
+    assert not (tmp_path / "a.yaml").exists()
@@ -0,0 +1,83 @@
+"""Regression tests for update_pyproject_tools.py."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("tomlkit")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import update_pyproject_tools  # noqa: E402
+
+
+def test_save_toml_keeps_symlinks(tmp_path: Path) -> None:
+    target = tmp_path / "real" / "pyproject.toml"
+    target.parent.mkdir()
+    target.write_text('[project]\nname = "x"\n')
+    link = tmp_path / "pyproject.toml"
+    link.symlink_to(target)
+
+    data = update_pyproject_tools.load_toml(link)
+    data["project"]["name"] = "y"
+    update_pyproject_tools.save_toml(data, link)
+
+    assert link.is_symlink()
+    assert target.read_text() == '[project]\nname = "y"\n'
+    assert sorted(p.name for p in target.parent.iterdir()) == ["pyproject.toml"]
+
+
+def test_template_comments_and_layout_are_copied(tmp_path: Path) -> None:
+    template = tmp_path / "global.toml"
+    template.write_text(
+        "[tool.ruff.lint]\n"
+        "# Rules enforced in every project\n"
+        "select = [\n"
+        '    "E",  # errors\n'
+        '    "F",\n'
+        "]\n"
+    )
+    project = tmp_path / "pyproject.toml"
+    project.write_text('[project]\nname = "x"\n')
+
+    update_pyproject_tools.update_pyproject_tools(template, project)
+    assert project.read_text().endswith(template.read_text())
+
+
+def test_merge_preserves_untouched_sections_and_order(tmp_path: Path) -> None:
+    template = tmp_path / "global.toml"
+    template.write_text(
+        "[tool.ruff]\n"
+        "# Shared line length\n"
+        "line-length = 100\n"
+        "\n"
+        "[tool.mypy]\n"
+        "strict = true\n"
+        "\n"
+        "[tool.uv]\n"
+        "x = 1\n"
+    )
+    project = tmp_path / "pyproject.toml"
+    head = (
+        "[project]\n"
+        'name = "x"  # project name\n'
+        "\n"
+        "# uv settings\n"
+        "[tool.uv]\n"
+        "dev-dependencies = []  # keep\n"
+        "\n"
+        "# old ruff\n"
+    )
+    project_only = "\n[tool.project-only]\nkeep = true  # mine\n"
+    tail = '\n[dependency-groups]\ndev = ["pytest"]\n'
+    project.write_text(head + "[tool.ruff]\nline-length = 80\n" + project_only + tail)
+
+    update_pyproject_tools.update_pyproject_tools(template, project)
+    assert project.read_text() == (
+        head
+        + "[tool.ruff]\n# Shared line length\nline-length = 100\n"
+        + project_only
+        + "\n[tool.mypy]\nstrict = true\n"
+        + tail
+    )
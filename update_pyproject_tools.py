@@ -7,6 +7,8 @@ a project's pyproject.toml, preserving project-specific settings like
 dependencies, UV configuration, and dependency groups, including comments.
 """
 
+import os
+import shutil
 import sys
 from pathlib import Path
 from typing import Any, Dict
@@ -15,14 +17,29 @@ import tomlkit
 
 def load_toml(file_path: str | Path) -> Dict[str, Any]:
     """Load a TOML file with comments preserved."""
-    with open(file_path, "r") as f:
-        return tomlkit.load(f)
+    with open(file_path, "rb") as f:
+        return tomlkit.parse(f.read())
 
 
 def save_toml(data: Dict[str, Any], file_path: str | Path) -> None:
-    """Save TOML data with comments preserved."""
-    with open(file_path, "w") as f:
-        tomlkit.dump(data, f)
+    """Save TOML data with comments preserved.
+
+    The data is written to a temporary file next to the target, which then
+    replaces the target, so an interrupted write never leaves a partial file.
+    Symlinks are resolved first, so the file they point to is replaced rather
+    than the link itself.
+    """
+    path = Path(file_path).resolve()
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(tomlkit.dumps(data).encode("utf-8"))
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def update_pyproject_tools(
@@ -39,18 +56,22 @@ def update_pyproject_tools(
 
     Updates all [tool.*] sections except [tool.uv]
     """
-    # Load both files (preserving comments in project file)
+    # Load both files with tomlkit; the template's tool sections are copied into
+    # the project file, so their comments and formatting must be kept too
     global_config = load_toml(global_pyproject_path)
     project_config = load_toml(project_pyproject_path)
 
-    # Update tool sections from global (except uv which is preserved)
+    # Update tool sections from global (except uv which is preserved). Sections
+    # are assigned in place in the project's [tool] table: moving tomlkit items
+    # into a new table would change the spacing around untouched sections.
     if "tool" in global_config:
         if "tool" not in project_config:
             project_config["tool"] = tomlkit.table()
+        project_tool = project_config["tool"]
 
         for key, value in global_config["tool"].items():
             if key != "uv":  # Preserve project's uv config
-                project_config["tool"][key] = value
+                project_tool[key] = value
 
     # Save updated config (preserves all comments and formatting)
     save_toml(project_config, project_pyproject_path)